@@ -1,12 +1,42 @@
+#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, XSD
 from rdflib.plugins.sparql import prepareQuery
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import functools
+import os
+import sys
+
+import pandas as pd
 
 # الخطوة 1: تحميل الأنطولوجيا من الملف
 # Step 1: Load the ontology from the file
-g = Graph()
-g.parse("HospitalManagementOntologyDesignPattern.xml", format="xml") # Here but ontology file directory
+# يُستخدم مخزن Oxigraph المكتوب بلغة Rust إن كان متاحاً لتسريع الاستعلامات
+# The Rust-backed Oxigraph store is used when available for faster joins
+try:
+    g = Graph(store="Oxigraph")
+except Exception:
+    # oxrdflib is not installed — fall back to the default in-memory store
+    g = Graph()
+
+# تحليل RDF/XML هو الأبطأ في rdflib؛ تُفضَّل نسخة Turtle المحوّلة مسبقاً،
+# وتُحفَظ نسخة N-Triples محلياً بعد أول تشغيل
+# RDF/XML is rdflib's slowest parser: prefer the pre-converted Turtle
+# copy, and keep a local N-Triples cache after the first run
+ONTOLOGY_XML = "HospitalManagementOntologyDesignPattern.xml" # Here but ontology file directory
+ONTOLOGY_TTL = "HospitalManagementOntologyDesignPattern.ttl"
+ONTOLOGY_CACHE = "ontology.nt"
+
+if os.path.exists(ONTOLOGY_CACHE) and os.path.getmtime(ONTOLOGY_CACHE) >= os.path.getmtime(ONTOLOGY_XML):
+    g.parse(ONTOLOGY_CACHE, format="nt")
+else:
+    if os.path.exists(ONTOLOGY_TTL) and os.path.getmtime(ONTOLOGY_TTL) >= os.path.getmtime(ONTOLOGY_XML):
+        g.parse(ONTOLOGY_TTL, format="turtle")
+    else:
+        g.parse(ONTOLOGY_XML, format="xml")
+    g.serialize(ONTOLOGY_CACHE, format="nt", encoding="utf-8")
 
 print("✅ تم تحميل الأنطولوجيا بنجاح | Ontology loaded successfully")
 print(f"📊 عدد البيانات الثلاثية: {len(g)} | Number of triples: {len(g)}\n")
@@ -15,241 +45,328 @@ print(f"📊 عدد البيانات الثلاثية: {len(g)} | Number of trip
 # Define namespaces
 HODP = Namespace("http://www.semanticweb.org/healthcare-ontology#")
 
-# الاستعلام 1: الحصول على جميع الأطباء المخضرمين (خبرة > 15 سنة)
-# Query 1: Get all senior doctors (experience > 15 years)
-query1 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-SELECT ?doctor ?firstName ?lastName ?specialization ?yearsExperience ?hospital
-WHERE {
-    ?doctor rdf:type hodp:Doctor .
-    ?doctor hodp:firstName ?firstName .
-    ?doctor hodp:lastName ?lastName .
-    ?doctor hodp:hasSpecialization ?spec .
-    ?spec rdfs:label ?specialization .
-    ?doctor hodp:yearsExperience ?yearsExperience .
-    ?doctor hodp:worksAt ?hospital .
-    FILTER (?yearsExperience > 15)
+# خريطة البادئات المشتركة تُعرَّف مرة واحدة وتُمرَّر لكل prepareQuery
+# The shared prefix map is defined once and passed to every prepareQuery
+NS = {"hodp": HODP, "rdf": RDF, "rdfs": RDFS, "xsd": XSD}
+
+
+# استخراج الاسم المحلي من المعرف دون إنشاء قائمة وسيطة كما يفعل split؛
+# المعرفات تتكرر كثيراً بين الصفوف فتُحفَظ النتيجة في ذاكرة تخزين
+# Extract the local name from an IRI without split()'s intermediate list;
+# the same URIRefs recur across many rows, so memoize per IRI
+@functools.lru_cache(maxsize=None)
+def local(iri):
+    s = str(iri)
+    i = s.rfind('#')
+    return s[i + 1:] if i >= 0 else s
+
+# بذر المتغير من فهرس النوع عبر VALUES بدل نمط rdf:type داخل الاستعلام
+# Seed a variable from the type index with a VALUES block instead of an
+# rdf:type pattern the BGP machinery has to scan; rdflib cannot evaluate
+# an empty VALUES table, so classes without instances keep the original pattern
+def seed_values(var, cls):
+    iris = list(g.subjects(RDF.type, cls))
+    if not iris:
+        return f"?{var} rdf:type <{cls}> ."
+    return f"VALUES ?{var} {{ {' '.join(f'<{iri}>' for iri in iris)} }}"
+
+
+_SEEDS = {
+    "treatment_seed": seed_values("treatment", HODP.Treatment),
+    "appointment_seed": seed_values("appointment", HODP.Appointment),
+    "patient_seed": seed_values("patient", HODP.Patient),
 }
-ORDER BY DESC(?yearsExperience)
-"""
-
-print("👨‍⚕️ الاستعلام 1: الأطباء المخضرمين (خبرة > 15 سنة)")
-print("Query 1: Senior Doctors (experience > 15 years)")
-print("-" * 70)
-
-results1 = g.query(query1)
-for row in results1:
-    print(f"الطبيب: {row.firstName} {row.lastName}")
-    print(f"التخصص: {row.specialization}")
-    print(f"سنوات الخبرة: {row.yearsExperience}")
-    print(f"مكان العمل: {row.hospital.split('#')[1]}")
-    print("-" * 50)
-
-print(f"📈 العدد الإجمالي: {len(results1)} طبيب مخضرم\n")
-
-# الاستعلام 2: العلاجات عالية التكلفة (تكلفة > 2000)
-# Query 2: High cost treatments (cost > 2000)
-query2 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 
+# استعلام العلاجات المدمج: يغذي التقريرين 2 و6 بمسح واحد
+# Fused treatments query: feeds reports 2 and 6 from a single scan.
+# التقرير 6 لا يتطلب إلا النوع والتكلفة، فتبقى بقية الأنماط اختيارية
+# Report 6 only requires type + cost, so the attributes report 2 needs
+# stay OPTIONAL here and report 2 filters out incomplete rows itself
+treatments_query = """
 SELECT ?treatment ?treatmentType ?description ?cost ?treatmentDate ?patient
 WHERE {
-    ?treatment rdf:type hodp:Treatment .
+    %(treatment_seed)s
     ?treatment hodp:treatmentType ?treatmentType .
-    ?treatment hodp:description ?description .
     ?treatment hodp:cost ?cost .
-    ?treatment hodp:treatmentDate ?treatmentDate .
-    ?treatment hodp:isResultOf ?appointment .
-    ?appointment hodp:isAppointmentOf ?patient .
-    FILTER (?cost > 2000)
+    OPTIONAL { ?treatment hodp:description ?description }
+    OPTIONAL { ?treatment hodp:treatmentDate ?treatmentDate }
+    OPTIONAL {
+        ?treatment hodp:isResultOf ?appointment .
+        ?appointment hodp:isAppointmentOf ?patient .
+    }
 }
-ORDER BY DESC(?cost)
 """
 
-print("💰 الاستعلام 2: العلاجات عالية التكلفة (أكثر من 2000)")
-print("Query 2: High Cost Treatments (more than 2000)")
-print("-" * 70)
-
-results2 = g.query(query2)
-total_high_cost = 0
-for row in results2:
-    print(f"نوع العلاج: {row.treatmentType}")
-    print(f"الوصف: {row.description}")
-    print(f"التكلفة: ${float(row.cost):.2f}")
-    print(f"تاريخ العلاج: {row.treatmentDate}")
-    print(f"المريض: {row.patient.split('#')[1]}")
-    total_high_cost += float(row.cost)
-    print("-" * 50)
-
-print(f"💵 إجمالي تكلفة العلاجات عالية التكلفة: ${total_high_cost:.2f}\n")
-
 # الاستعلام 3: تحليل المواعيد حسب الحالة
 # Query 3: Appointment analysis by status
 query3 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-
 SELECT ?status (COUNT(?appointment) as ?count)
 WHERE {
-    ?appointment rdf:type hodp:Appointment .
+    %(appointment_seed)s
     ?appointment hodp:status ?status .
 }
 GROUP BY ?status
-ORDER BY DESC(?count)
 """
 
+# الاستعلام 4: توزيع المرضى حسب مزودي التأمين
+# Query 4: Patient distribution by insurance providers
+query4 = """
+SELECT ?insuranceProvider (COUNT(?patient) as ?patientCount)
+WHERE {
+    %(patient_seed)s
+    ?patient hodp:hasInsurance ?provider .
+    ?provider rdfs:label ?insuranceProvider .
+}
+GROUP BY ?insuranceProvider
+"""
+
+# الاستعلام 7: المرضى المسنين (عمر > 65 سنة)
+# Query 7: Elderly patients (age > 65 years)
+# يُحسب العمر في بايثون بعد الاستعلام بدل BIND/FILTER داخل محرك SPARQL
+# The age is computed in Python after the query instead of BIND/FILTER
+# inside the SPARQL engine, which re-evaluates now() per row
+query7 = """
+SELECT ?patient ?firstName ?lastName ?dateOfBirth ?insurance
+WHERE {
+    %(patient_seed)s
+    ?patient hodp:firstName ?firstName .
+    ?patient hodp:lastName ?lastName .
+    ?patient hodp:dateOfBirth ?dateOfBirth .
+    ?patient hodp:hasInsurance ?insurance .
+}
+"""
+
+# تجهيز الاستعلامات مرة واحدة بدل إعادة تحليلها عند كل استدعاء
+# Prepare all queries once instead of re-parsing them on every call
+_QUERY_TEXTS = {
+    "treatments": treatments_query,
+    "query3": query3,
+    "query4": query4,
+    "query7": query7,
+}
+
+PREPARED = {
+    name: prepareQuery(text % _SEEDS, initNs=NS)
+    for name, text in _QUERY_TEXTS.items()
+}
+
+# الرسم البياني للقراءة فقط بعد التحميل، لذا تُحفَظ نتائج كل استعلام في ذاكرة تخزين
+# The graph is read-only after loading, so query results are memoized;
+# re-running a report (e.g. interactively) costs a dict lookup only
+@functools.lru_cache(maxsize=32)
+def cached_query(name):
+    return tuple(g.query(PREPARED[name]))
+
+
+DoctorRow = namedtuple(
+    "DoctorRow",
+    ["doctor", "firstName", "lastName", "specialization", "yearsExperience", "hospital"],
+)
+
+
+# نجمة الطبيب تُجلب على مرحلتين بدل ربط سداسي داخل محرك SPARQL:
+# بذرة من فهرس النوع ثم قراءة الخصائص بفهرس الموضوع مباشرة
+# The doctor star is fetched in two passes instead of a 6-way BGP join:
+# seed from the type index, then per-subject indexed attribute lookups
+@functools.lru_cache(maxsize=None)
+def doctor_star_rows():
+    rows = []
+    # الفرز يثبّت ترتيب التعادل في الفرز حسب الخبرة بين تشغيلين
+    # Sorted so experience-sort ties come out in the same order on
+    # every run instead of hash-seed-dependent iteration order
+    for doctor in sorted(g.subjects(RDF.type, HODP.Doctor)):
+        first = g.value(doctor, HODP.firstName)
+        last = g.value(doctor, HODP.lastName)
+        years = g.value(doctor, HODP.yearsExperience)
+        # الربط الأصلي كان إلزاميًا: يُتجاهل أي طبيب تنقصه خاصية مطلوبة
+        # The original join was mandatory: skip doctors missing any
+        # required attribute instead of emitting None columns
+        if first is None or last is None or years is None:
+            continue
+        # التخصص ومكان العمل قد يتكرران، فيُنتج صف لكل تركيبة كما في الربط الأصلي
+        # hasSpecialization and worksAt can be multi-valued; emit one
+        # row per combination, exactly like the join they replace
+        for spec in g.objects(doctor, HODP.hasSpecialization):
+            label = g.value(spec, RDFS.label)
+            if label is None:
+                continue
+            for hospital in g.objects(doctor, HODP.worksAt):
+                rows.append(DoctorRow(doctor, first, last, label, years, hospital))
+    return tuple(rows)
+
+
+# الاستعلامات مستقلة وللقراءة فقط، فتُنفَّذ بالتوازي وتبقى الطباعة تسلسلية
+# The queries are independent and read-only, so run them in parallel;
+# printing below stays serial to keep the output deterministic
+with ThreadPoolExecutor(max_workers=len(PREPARED) + 1) as _executor:
+    _futures = {name: _executor.submit(cached_query, name) for name in PREPARED}
+    _futures["doctors"] = _executor.submit(doctor_star_rows)
+RESULTS = {name: future.result() for name, future in _futures.items()}
+
+# قوالب الصفوف تُبنى مرة واحدة؛ تنسيق % يمر عبر __str__ مباشرة
+# دون بروتوكول __format__ الأغلى الذي تستدعيه f-strings لكل Literal
+# Row templates built once; %-formatting dispatches straight through
+# __str__ instead of the costlier per-Literal __format__ protocol
+TPL1 = "الطبيب: %s %s\nالتخصص: %s\nسنوات الخبرة: %s\nمكان العمل: %s\n" + "-" * 50 + "\n"
+TPL2 = "نوع العلاج: %s\nالوصف: %s\nالتكلفة: $%.2f\nتاريخ العلاج: %s\nالمريض: %s\n" + "-" * 50 + "\n"
+TPL3 = "الحالة: %s - العدد: %s\n"
+TPL4 = "مزود التأمين: %s - عدد المرضى: %s\n"
+TPL5 = "التخصص: %s - المستشفى: %s - عدد الأطباء: %s\n"
+TPL6 = "نوع العلاج: %s\nعدد المرات: %d - متوسط التكلفة: $%.2f - إجمالي التكلفة: $%.2f\n" + "-" * 50 + "\n"
+TPL7 = "المريض: %s %s\nتاريخ الميلاد: %s - العمر: %s سنة\nمزود التأمين: %s\n" + "-" * 50 + "\n"
+
+# تنفيذ الاستعلامين المدمجين مرة واحدة واشتقاق التقارير الأربعة منهما
+# Run the two fused queries once and derive all four reports from them
+# تحويل الصفوف إلى أعمدة (DataFrame) مرة واحدة: تجميع وفرز متجهيان في C
+# Convert the rows to a columnar DataFrame once; the filtering, sorting
+# and grouping below then run vectorized in C instead of per-row Python
+doctors_df = pd.DataFrame(
+    [
+        (str(r.firstName), str(r.lastName), str(r.specialization),
+         int(r.yearsExperience), local(r.hospital))
+        for r in RESULTS["doctors"]
+    ],
+    columns=["first", "last", "specialization", "years", "hospital"],
+)
+treatments_df = pd.DataFrame(
+    [
+        (str(r.treatmentType),
+         str(r.description) if r.description is not None else None,
+         float(r.cost),
+         str(r.treatmentDate) if r.treatmentDate is not None else None,
+         local(r.patient) if r.patient is not None else None)
+        for r in RESULTS["treatments"]
+    ],
+    columns=["type", "description", "cost", "date", "patient"],
+)
+
+print("👨‍⚕️ الاستعلام 1: الأطباء المخضرمين (خبرة > 15 سنة)")
+print("Query 1: Senior Doctors (experience > 15 years)")
+print("-" * 70)
+
+senior_df = doctors_df[doctors_df.years > 15].sort_values("years", ascending=False)
+# تجميع الأسطر في ذاكرة مؤقتة وكتابتها دفعة واحدة بدل print لكل سطر
+# Buffer the rows and write them in one call instead of a print per line
+buf = []
+for row in senior_df.itertuples():
+    buf.append(TPL1 % (row.first, row.last, row.specialization, row.years, row.hospital))
+sys.stdout.write("".join(buf))
+
+print(f"📈 العدد الإجمالي: {len(senior_df)} طبيب مخضرم\n")
+
+print("💰 الاستعلام 2: العلاجات عالية التكلفة (أكثر من 2000)")
+print("Query 2: High Cost Treatments (more than 2000)")
+print("-" * 70)
+
+# dropna يعيد دلالة الربط الإلزامي للاستعلام 2 الأصلي
+# dropna restores query 2's original mandatory-join semantics; the
+# OPTIONAL columns above are required again for this report only
+high_cost_df = (
+    treatments_df[treatments_df.cost > 2000]
+    .dropna()
+    .sort_values("cost", ascending=False)
+)
+buf = []
+for row in high_cost_df.itertuples():
+    buf.append(TPL2 % (row.type, row.description, row.cost, row.date, row.patient))
+sys.stdout.write("".join(buf))
+
+# جمع التكاليف باختزال واحد على مستوى C بدل التجميع عنصراً عنصراً
+# Sum the costs with one C-level reduction instead of per-row accumulation
+total_high_cost = high_cost_df["cost"].sum()
+
+print(f"💵 إجمالي تكلفة العلاجات عالية التكلفة: ${total_high_cost:.2f}\n")
+
 print("📅 الاستعلام 3: تحليل المواعيد حسب الحالة")
 print("Query 3: Appointment Analysis by Status")
 print("-" * 70)
 
-results3 = g.query(query3)
+# الترتيب في بايثون بمفتاح عددي بسيط بدل ORDER BY داخل SPARQL
+# Sort in Python on a plain int key instead of SPARQL ORDER BY, which
+# compares rdflib Literals with per-comparison datatype checks
+results3 = sorted(RESULTS["query3"], key=lambda row: -int(row["count"]))
 total_appointments = 0
+status_counts = {}
+buf = []
 for row in results3:
-    print(f"الحالة: {row.status} - العدد: {row.count}")
-    total_appointments += int(row.count)
+    # row["count"] بدل row.count لتجنب التصادم مع tuple.count
+    # row["count"] instead of row.count to avoid colliding with tuple.count
+    buf.append(TPL3 % (row.status, row["count"]))
+    status_counts[str(row.status)] = int(row["count"])
+    total_appointments += int(row["count"])
+sys.stdout.write("".join(buf))
 
 print(f"📊 إجمالي عدد المواعيد: {total_appointments}")
 
-# حساب معدل الإلغاء وعدم الحضور
-cancel_query = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-
-SELECT (COUNT(?appointment) as ?problemCount)
-WHERE {
-    ?appointment rdf:type hodp:Appointment .
-    ?appointment hodp:status ?status .
-    FILTER (?status = "Cancelled" || ?status = "No-show")
-}
-"""
-
-problem_results = g.query(cancel_query)
-problem_count = int(list(problem_results)[0].problemCount)
+# حساب معدل الإلغاء وعدم الحضور من نتائج الاستعلام 3 نفسها بدل استعلام ثانٍ
+# Derive the cancellation / no-show rate from query 3's results instead of a second query
+problem_count = status_counts.get("Cancelled", 0) + status_counts.get("No-show", 0)
 problem_rate = (problem_count / total_appointments) * 100 if total_appointments > 0 else 0
 
 print(f"⚠️  معدل المشاكل (إلغاء/عدم حضور): {problem_rate:.1f}%\n")
 
-# الاستعلام 4: توزيع المرضى حسب مزودي التأمين
-# Query 4: Patient distribution by insurance providers
-query4 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-SELECT ?insuranceProvider (COUNT(?patient) as ?patientCount)
-WHERE {
-    ?patient rdf:type hodp:Patient .
-    ?patient hodp:hasInsurance ?provider .
-    ?provider rdfs:label ?insuranceProvider .
-}
-GROUP BY ?insuranceProvider
-ORDER BY DESC(?patientCount)
-"""
-
 print("🏥 الاستعلام 4: توزيع المرضى حسب مزودي التأمين")
 print("Query 4: Patient Distribution by Insurance Providers")
 print("-" * 70)
 
-results4 = g.query(query4)
+results4 = sorted(RESULTS["query4"], key=lambda row: -int(row.patientCount))
+buf = []
 for row in results4:
-    print(f"مزود التأمين: {row.insuranceProvider} - عدد المرضى: {row.patientCount}")
+    buf.append(TPL4 % (row.insuranceProvider, row.patientCount))
+sys.stdout.write("".join(buf))
 
 print()
 
-# الاستعلام 5: الأطباء حسب التخصص والمكان
-# Query 5: Doctors by specialization and location
-query5 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-SELECT ?specialization ?hospital (COUNT(?doctor) as ?doctorCount)
-WHERE {
-    ?doctor rdf:type hodp:Doctor .
-    ?doctor hodp:hasSpecialization ?spec .
-    ?spec rdfs:label ?specialization .
-    ?doctor hodp:worksAt ?hospital .
-}
-GROUP BY ?specialization ?hospital
-ORDER BY ?specialization DESC(?doctorCount)
-"""
-
 print("🎯 الاستعلام 5: توزيع الأطباء حسب التخصص والمستشفى")
 print("Query 5: Doctor Distribution by Specialization and Hospital")
 print("-" * 70)
 
-results5 = g.query(query5)
-for row in results5:
-    hospital_name = row.hospital.split('#')[1] if '#' in row.hospital else row.hospital
-    print(f"التخصص: {row.specialization} - المستشفى: {hospital_name} - عدد الأطباء: {row.doctorCount}")
+distribution = doctors_df.groupby(["specialization", "hospital"]).size()
+buf = []
+for (specialization, hospital), doctor_count in sorted(
+    distribution.items(), key=lambda item: (item[0][0], -item[1])
+):
+    buf.append(TPL5 % (specialization, hospital, doctor_count))
+sys.stdout.write("".join(buf))
 
 print()
 
-# الاستعلام 6: العلاجات الأكثر شيوعاً وتكلفتها المتوسطة
-# Query 6: Most common treatments and their average cost
-query6 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-
-SELECT ?treatmentType (COUNT(?treatment) as ?count) (AVG(?cost) as ?avgCost) (SUM(?cost) as ?totalCost)
-WHERE {
-    ?treatment rdf:type hodp:Treatment .
-    ?treatment hodp:treatmentType ?treatmentType .
-    ?treatment hodp:cost ?cost .
-}
-GROUP BY ?treatmentType
-ORDER BY DESC(?count)
-"""
-
 print("🩺 الاستعلام 6: تحليل العلاجات (التكرار والتكلفة)")
 print("Query 6: Treatment Analysis (Frequency and Cost)")
 print("-" * 70)
 
-results6 = g.query(query6)
-for row in results6:
-    avg_cost = float(row.avgCost) if row.avgCost else 0
-    total_cost = float(row.totalCost) if row.totalCost else 0
-    print(f"نوع العلاج: {row.treatmentType}")
-    print(f"عدد المرات: {row.count} - متوسط التكلفة: ${avg_cost:.2f} - إجمالي التكلفة: ${total_cost:.2f}")
-    print("-" * 50)
-
-# الاستعلام 7: المرضى المسنين (عمر > 65 سنة)
-# Query 7: Elderly patients (age > 65 years)
-query7 = """
-PREFIX hodp: <http://www.semanticweb.org/healthcare-ontology#>
-PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
-
-SELECT ?patient ?firstName ?lastName ?dateOfBirth ?age ?insurance
-WHERE {
-    ?patient rdf:type hodp:Patient .
-    ?patient hodp:firstName ?firstName .
-    ?patient hodp:lastName ?lastName .
-    ?patient hodp:dateOfBirth ?dateOfBirth .
-    ?patient hodp:hasInsurance ?insurance .
-    
-    BIND (year(now()) - year(?dateOfBirth) AS ?age)
-    FILTER (?age > 65)
-}
-ORDER BY DESC(?age)
-"""
+type_stats = (
+    treatments_df.groupby("type")["cost"]
+    .agg(count="count", avg="mean", total="sum")
+    .sort_values("count", ascending=False)
+)
+buf = []
+for treatment_type, row in type_stats.iterrows():
+    buf.append(TPL6 % (treatment_type, row["count"], row["avg"], row["total"]))
+sys.stdout.write("".join(buf))
 
 print("👵 الاستعلام 7: المرضى المسنين (عمر > 65 سنة)")
 print("Query 7: Elderly Patients (age > 65 years)")
 print("-" * 70)
 
-results7 = g.query(query7)
-for row in results7:
-    insurance_name = row.insurance.split('#')[1] if '#' in row.insurance else row.insurance
-    print(f"المريض: {row.firstName} {row.lastName}")
-    print(f"تاريخ الميلاد: {row.dateOfBirth} - العمر: {row.age} سنة")
-    print(f"مزود التأمين: {insurance_name}")
-    print("-" * 50)
-
-print(f"👥 عدد المرضى المسنين: {len(results7)}")
+# تُحوَّل النتائج إلى قائمة مرة واحدة حتى لا يعاد مسحها عند العدّ
+# Materialize the result once so counting does not re-walk it;
+# this_year is resolved a single time for the whole batch
+this_year = datetime.date.today().year
+rows7 = sorted(
+    (
+        (row, this_year - row.dateOfBirth.toPython().year)
+        for row in RESULTS["query7"]
+        if this_year - row.dateOfBirth.toPython().year > 65
+    ),
+    key=lambda pair: pair[1],
+    reverse=True,
+)
+buf = []
+for row, age in rows7:
+    buf.append(TPL7 % (row.firstName, row.lastName, row.dateOfBirth, age, local(row.insurance)))
+sys.stdout.write("".join(buf))
+
+print(f"👥 عدد المرضى المسنين: {len(rows7)}")
 
 print("\n🎉 اكتملت جميع الاستعلامات بنجاح! | All queries completed successfully!")